@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+from concurrent.futures import ThreadPoolExecutor
+
 import typer
 from snakesay import snakesay
 
@@ -49,8 +51,7 @@ def autoconfigure(
     project.find_django_files()
     project.update_wsgi_file()
     project.update_settings_file()
-    project.run_collectstatic()
-    project.run_migrate()
+    project.run_collectstatic_and_migrate()
     project.webapp.reload()
     typer.echo(snakesay(f"All done!  Your site is now live at https://{domain_name}\n"))
     project.start_bash()
@@ -88,12 +89,16 @@ def start(
     domain = ensure_domain(domain_name)
     project = DjangoProject(domain, python_version)
     project.sanity_checks(nuke=nuke)
+    if nuke:
+        project.start_deleting_project_path()
     project.create_virtualenv(django_version, nuke=nuke)
     project.run_startproject(nuke=nuke)
     project.find_django_files()
     project.update_settings_file()
-    project.run_collectstatic()
-    project.create_webapp(nuke=nuke)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        collectstatic = executor.submit(project.run_collectstatic)
+        project.create_webapp(nuke=nuke)
+        collectstatic.result()
     project.add_static_file_mappings()
 
     project.update_wsgi_file()
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
 from pathlib import Path
 import re
 import shutil
@@ -7,10 +10,34 @@ from packaging import version
 from snakesay import snakesay
 
 from pythonanywhere.exceptions import SanityException
+from pythonanywhere.utils import fast_rmtree
 from .project import Project
 
 
+# Runs the project's manage.py once per command in a single interpreter, so Django is only
+# imported once.  A manage.py that ends with sys.exit(0) must not stop the remaining commands.
+_RUN_MANAGE_PY_COMMANDS = """
+import json, os, runpy, sys
+manage_py, commands = sys.argv[1], json.loads(sys.argv[2])
+sys.path[0] = os.path.dirname(os.path.abspath(manage_py))
+for command in commands:
+    sys.argv = [manage_py] + command
+    try:
+        runpy.run_path(manage_py, run_name='__main__')
+    except SystemExit as e:
+        if e.code:
+            raise
+"""
+
+
+@lru_cache(maxsize=1)
+def _wsgi_file_template():
+    return (Path(__file__).parent / 'wsgi_file_template.py').read_text()
+
+
 class DjangoProject(Project):
+    _project_path_deletion = None
+
     def django_version_newer_or_equal_than(self, this_version):
         return version.parse(self.virtualenv.get_version("django")) >= version.parse(this_version)
 
@@ -60,17 +87,25 @@ class DjangoProject(Project):
             return f'-r {requirements_txt.resolve()}'
         return 'django'
 
+    def start_deleting_project_path(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._project_path_deletion = executor.submit(fast_rmtree, self.project_path)
+        executor.shutdown(wait=False)
+
     def run_startproject(self, nuke):
         print(snakesay('Starting Django project'))
-        if nuke and self.project_path.exists():
-            shutil.rmtree(str(self.project_path))
-        self.project_path.mkdir()
-
-        new_django = self.django_version_newer_or_equal_than("4.0")
-        django_admin_executable = "django-admin" if new_django else "django-admin.py"
+        if nuke:
+            if self._project_path_deletion is None:
+                fast_rmtree(self.project_path)
+            else:
+                self._project_path_deletion.result()
+        self.project_path.mkdir(exist_ok=True)
 
         subprocess.check_call([
-            str(Path(self.virtualenv.path) / "bin" / django_admin_executable),
+            str(Path(self.virtualenv.path) / "bin/python"),
+            "-c",
+            "import sys; from django.core.management import execute_from_command_line; "
+            "execute_from_command_line(sys.argv)",
             "startproject",
             "mysite",
             str(self.project_path),
@@ -91,8 +126,7 @@ class DjangoProject(Project):
     def update_settings_file(self):
         print(snakesay('Updating settings.py'))
 
-        with self.settings_path.open() as f:
-            settings = f.read()
+        settings = self.settings_path.read_text()
         new_settings = settings.replace(
             'ALLOWED_HOSTS = []',
             f'ALLOWED_HOSTS = [{self.domain!r}]'
@@ -113,8 +147,7 @@ class DjangoProject(Project):
             else:
                 new_settings += "\nMEDIA_ROOT = os.path.join(BASE_DIR, 'media')"
 
-        with self.settings_path.open('w') as f:
-            f.write(new_settings)
+        self.settings_path.write_text(new_settings)
 
 
     def run_collectstatic(self):
@@ -127,17 +160,18 @@ class DjangoProject(Project):
         ])
 
 
-    def run_migrate(self):
-        print(snakesay('Running migrate database'))
+    def run_collectstatic_and_migrate(self):
+        print(snakesay('Running collectstatic and migrate database'))
         subprocess.check_call([
             str(Path(self.virtualenv.path) / 'bin/python'),
+            '-c',
+            _RUN_MANAGE_PY_COMMANDS,
             str(self.manage_py_path),
-            'migrate',
+            json.dumps([['collectstatic', '--noinput'], ['migrate']]),
         ])
 
 
     def update_wsgi_file(self):
         print(snakesay(f'Updating wsgi file at {self.wsgi_file_path}'))
-        template = (Path(__file__).parent / 'wsgi_file_template.py').open().read()
         with self.wsgi_file_path.open('w') as f:
-            f.write(template.format(project=self))
+            f.write(_wsgi_file_template().format(project=self))
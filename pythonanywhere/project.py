@@ -1,6 +1,7 @@
 from pathlib import Path
 import uuid
 
+from pythonanywhere_core.base import PYTHON_VERSIONS
 from pythonanywhere_core.webapp import Webapp
 from snakesay import snakesay
 
@@ -22,9 +23,20 @@ class Project:
 
 
     def sanity_checks(self, nuke):
+        if self.python_version not in PYTHON_VERSIONS:
+            raise SanityException(
+                "Python {python_version} is not supported.\n\n"
+                "Use one of: {supported}".format(
+                    python_version=self.python_version,
+                    supported=", ".join(PYTHON_VERSIONS),
+                )
+            )
+        if not nuke:
+            self._local_sanity_checks()
         self.webapp.sanity_checks(nuke=nuke)
-        if nuke:
-            return
+
+
+    def _local_sanity_checks(self):
         if self.virtualenv.path.exists():
             raise SanityException(
                 "You already have a virtualenv for {domain}.\n\n"
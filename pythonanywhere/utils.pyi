@@ -1 +1,5 @@
+from pathlib import Path
+from typing import Union
+
 def ensure_domain(domain: str) -> str: ...
+def fast_rmtree(path: Union[str, Path]) -> None: ...
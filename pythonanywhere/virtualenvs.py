@@ -4,6 +4,8 @@ from pathlib import Path
 
 from snakesay import snakesay
 
+from pythonanywhere.utils import fast_rmtree
+
 
 class Virtualenv:
     def __init__(self, domain, python_version):
@@ -16,10 +18,9 @@ class Virtualenv:
 
     def create(self, nuke):
         print(snakesay(f"Creating virtualenv with Python{self.python_version}"))
-        command = f"mkvirtualenv --python=python{self.python_version} {self.domain}"
         if nuke:
-            command = f"rmvirtualenv {self.domain} && {command}"
-        subprocess.check_call(["bash", "-c", f"source virtualenvwrapper.sh && {command}"])
+            fast_rmtree(self.path)
+        subprocess.check_call([f"python{self.python_version}", "-m", "venv", str(self.path)])
         return self
 
     def pip_install(self, packages):
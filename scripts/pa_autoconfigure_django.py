@@ -36,8 +36,7 @@ def main(repo_url, branch, domain, python_version, nuke):
     project.find_django_files()
     project.update_wsgi_file()
     project.update_settings_file()
-    project.run_collectstatic()
-    project.run_migrate()
+    project.run_collectstatic_and_migrate()
     project.webapp.reload()
     print(snakesay(f'All done!  Your site is now live at https://{domain}'))
     print()
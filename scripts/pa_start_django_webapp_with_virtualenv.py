@@ -12,6 +12,8 @@ Options:
   --nuke                    *Irrevocably* delete any existing web app config on this domain. Irrevocably.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from docopt import docopt
 from snakesay import snakesay
 
@@ -23,12 +25,16 @@ def main(domain, django_version, python_version, nuke):
     domain = ensure_domain(domain)
     project = DjangoProject(domain, python_version)
     project.sanity_checks(nuke=nuke)
+    if nuke:
+        project.start_deleting_project_path()
     project.create_virtualenv(django_version, nuke=nuke)
     project.run_startproject(nuke=nuke)
     project.find_django_files()
     project.update_settings_file()
-    project.run_collectstatic()
-    project.create_webapp(nuke=nuke)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        collectstatic = executor.submit(project.run_collectstatic)
+        project.create_webapp(nuke=nuke)
+        collectstatic.result()
     project.add_static_file_mappings()
 
     project.update_wsgi_file()
@@ -1,5 +1,6 @@
 import os
 import shutil
+import subprocess
 import tempfile
 from getpass import getuser
 from pathlib import Path
@@ -11,6 +12,9 @@ import pytest
 import responses
 
 
+_real_check_call = subprocess.check_call
+
+
 def _get_temp_dir():
     return Path(tempfile.mkdtemp())
 
@@ -80,6 +84,15 @@ def mock_subprocess():
             yield mock
 
 
+@pytest.fixture
+def mock_subprocess_except_rm(mock_subprocess):
+    # lets `rm` commands (eg from fast_rmtree) actually run, everything else is mocked out
+    mock_subprocess.check_call.side_effect = (
+        lambda command, **kwargs: _real_check_call(command, **kwargs) if command[0] == "rm" else None
+    )
+    yield mock_subprocess
+
+
 @pytest.fixture
 def api_responses(monkeypatch):
     with responses.RequestsMock() as r:
@@ -65,8 +65,7 @@ def test_autoconfigure_calls_all_stuff_in_right_order(mock_django_project):
         call.find_django_files(),
         call.update_wsgi_file(),
         call.update_settings_file(),
-        call.run_collectstatic(),
-        call.run_migrate(),
+        call.run_collectstatic_and_migrate(),
         call.webapp.reload(),
         call.start_bash(),
     ]
@@ -155,14 +154,19 @@ def test_start_calls_all_stuff_in_right_order(mock_django_project):
     )
 
     assert mock_django_project.call_args == call("www.domain.com", "python.version")
-    assert mock_django_project.return_value.method_calls == [
+    method_calls = mock_django_project.return_value.method_calls
+    assert method_calls[:6] == [
         call.sanity_checks(nuke=True),
+        call.start_deleting_project_path(),
         call.create_virtualenv("django.version", nuke=True),
         call.run_startproject(nuke=True),
         call.find_django_files(),
         call.update_settings_file(),
-        call.run_collectstatic(),
-        call.create_webapp(nuke=True),
+    ]
+    # collectstatic and webapp creation run concurrently, so either may come first
+    assert call.run_collectstatic() in method_calls[6:8]
+    assert call.create_webapp(nuke=True) in method_calls[6:8]
+    assert method_calls[8:] == [
         call.add_static_file_mappings(),
         call.update_wsgi_file(),
         call.webapp.reload(),
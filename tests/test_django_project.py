@@ -1,11 +1,14 @@
+import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
 from pathlib import Path
 from platform import python_version
 from textwrap import dedent
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -202,49 +205,73 @@ class TestRunStartproject:
         project.run_startproject(nuke=False)
         assert (fake_home / "mydomain.com").is_dir()
 
-    def test_calls_startproject_for_older_django(self, mock_subprocess, fake_home, virtualenvs_folder):
+    def test_handles_folder_already_existing(self, mock_subprocess, fake_home, virtualenvs_folder):
         project = DjangoProject("mydomain.com", "python.version")
-        project.virtualenv.get_version = Mock(return_value="3.9")
-        project.run_startproject(nuke=False)
-        assert mock_subprocess.check_call.call_args == call(
-            [
-                str(Path(project.virtualenv.path / "bin/django-admin.py")),
-                "startproject",
-                "mysite",
-                str(fake_home / "mydomain.com"),
-            ]
-        )
+        (fake_home / "mydomain.com").mkdir()
+        project.run_startproject(nuke=False)  # should not raise
 
-
-    def test_calls_startproject_for_newer_django(self, mock_subprocess, fake_home, virtualenvs_folder):
+    def test_calls_startproject_with_virtualenv_python(self, mock_subprocess, fake_home, virtualenvs_folder):
         project = DjangoProject("mydomain.com", "python.version")
-        project.virtualenv.get_version = Mock(return_value="4.0")
         project.run_startproject(nuke=False)
-        assert mock_subprocess.check_call.call_args == call(
-            [
-                str(Path(project.virtualenv.path / "bin/django-admin")),
-                "startproject",
-                "mysite",
-                str(fake_home / "mydomain.com"),
-            ]
-        )
+        args, kwargs = mock_subprocess.check_call.call_args
+        command_list = args[0]
+        assert command_list[:2] == [str(project.virtualenv.path / "bin/python"), "-c"]
+        assert "execute_from_command_line(sys.argv)" in command_list[2]
+        assert command_list[3:] == ["startproject", "mysite", str(fake_home / "mydomain.com")]
 
-    def test_nuke_option_deletes_directory_first(self, mock_subprocess, fake_home, virtualenvs_folder):
+    def test_nuke_option_deletes_directory_first(self, mock_subprocess_except_rm, fake_home, virtualenvs_folder):
         project = DjangoProject("mydomain.com", "python.version")
         (fake_home / project.domain).mkdir()
         old_file = fake_home / project.domain / "old_file.py"
         old_file.write_text("old stuff")
-        project.virtualenv.get_version = Mock(return_value="1.0")
 
         project.run_startproject(nuke=True)
 
         assert not old_file.exists()
+        assert mock_subprocess_except_rm.check_call.call_args_list[0] == call(["rm", "-rf", str(project.project_path)])
 
     def test_nuke_option_handles_directory_not_existing(self, mock_subprocess, fake_home, virtualenvs_folder):
         project = DjangoProject("mydomain.com", "python.version")
         project.virtualenv.get_version = Mock(return_value="1.0")
         project.run_startproject(nuke=True)  # should not raise
 
+    def test_nuke_option_waits_for_background_deletion(self, mock_subprocess, fake_home, virtualenvs_folder):
+        project = DjangoProject("mydomain.com", "python.version")
+        (fake_home / project.domain).mkdir()
+        old_file = fake_home / project.domain / "old_file.py"
+        old_file.write_text("old stuff")
+        deletion_allowed = threading.Event()
+        events = []
+
+        def blocked_rmtree(path):
+            deletion_allowed.wait()
+            shutil.rmtree(str(path))
+            events.append("deleted")
+
+        mock_subprocess.check_call.side_effect = lambda *_, **__: events.append("startproject")
+
+        with patch("pythonanywhere.django_project.fast_rmtree", blocked_rmtree):
+            project.start_deleting_project_path()
+            startproject = threading.Thread(target=project.run_startproject, kwargs={"nuke": True})
+            startproject.start()
+            assert events == []
+            deletion_allowed.set()
+            startproject.join()
+
+        assert events == ["deleted", "startproject"]
+        assert not old_file.exists()
+
+    def test_nuke_option_raises_if_background_deletion_fails(self, mock_subprocess, fake_home, virtualenvs_folder):
+        project = DjangoProject("mydomain.com", "python.version")
+        (fake_home / project.domain).mkdir()
+        mock_subprocess.check_call.side_effect = subprocess.CalledProcessError(1, "rm")
+
+        project.start_deleting_project_path()
+        with pytest.raises(subprocess.CalledProcessError):
+            project.run_startproject(nuke=True)
+
+        assert mock_subprocess.check_call.call_args_list == [call(["rm", "-rf", str(project.project_path)])]
+
 
 @pytest.fixture
 def non_nested_submodule():
@@ -482,14 +509,76 @@ class TestRunCollectStatic:
         )
 
 
-class TestRunMigrate:
-    def test_runs_manage_py_in_correct_virtualenv(self, mock_subprocess, fake_home, virtualenvs_folder):
+@pytest.fixture
+def project_with_stub_django(fake_home, virtualenvs_folder):
+    project = DjangoProject("mydomain.com", "python.version")
+    (project.virtualenv.path / "bin").mkdir(parents=True)
+    (project.virtualenv.path / "bin/python").symlink_to(sys.executable)
+    project.manage_py_path = project.project_path / "manage.py"
+    project.project_path.mkdir()
+    project.manage_py_path.write_text(
+        dedent(
+            """
+            import os, sys
+            os.environ.setdefault("DJANGO_SETTINGS_MODULE", "custom.settings")
+            from django.core.management import execute_from_command_line
+            execute_from_command_line(sys.argv)
+            sys.exit(0)
+            """
+        )
+    )
+    stub_management = project.project_path / "django/core/management"
+    stub_management.mkdir(parents=True)
+    (project.project_path / "django/__init__.py").touch()
+    (project.project_path / "django/core/__init__.py").touch()
+    (stub_management / "__init__.py").write_text(
+        dedent(
+            """
+            import os, sys
+
+            def execute_from_command_line(argv):
+                with open(os.path.join(os.path.dirname(__file__), "log"), "a") as f:
+                    f.write(" ".join(argv[1:]) + " " + os.environ["DJANGO_SETTINGS_MODULE"] + "\\n")
+                if argv[1] == os.environ.get("STUB_FAILING_COMMAND"):
+                    sys.exit(1)
+            """
+        )
+    )
+    yield project, stub_management / "log"
+
+
+class TestRunCollectStaticAndMigrate:
+    def test_runs_both_commands_in_one_virtualenv_python(self, mock_subprocess, fake_home, virtualenvs_folder):
         project = DjangoProject("mydomain.com", "python.version")
         project.manage_py_path = Path("/path/to/manage.py")
-        project.run_migrate()
-        assert mock_subprocess.check_call.call_args == call(
-            [str(project.virtualenv.path / "bin/python"), str(project.manage_py_path), "migrate"]
-        )
+        project.run_collectstatic_and_migrate()
+        assert mock_subprocess.check_call.call_count == 1
+        args, kwargs = mock_subprocess.check_call.call_args
+        command_list = args[0]
+        assert command_list[:2] == [str(project.virtualenv.path / "bin/python"), "-c"]
+        assert command_list[3] == str(project.manage_py_path)
+        assert json.loads(command_list[4]) == [["collectstatic", "--noinput"], ["migrate"]]
+
+    def test_actually_runs_both_commands_through_projects_manage_py(self, project_with_stub_django, monkeypatch):
+        project, log = project_with_stub_django
+        monkeypatch.delenv("DJANGO_SETTINGS_MODULE", raising=False)
+
+        project.run_collectstatic_and_migrate()  # manage.py ends with sys.exit(0) after each command
+
+        assert log.read_text().splitlines() == [
+            "collectstatic --noinput custom.settings",
+            "migrate custom.settings",
+        ]
+
+    def test_stops_and_raises_if_a_command_fails(self, project_with_stub_django, monkeypatch):
+        project, log = project_with_stub_django
+        monkeypatch.delenv("DJANGO_SETTINGS_MODULE", raising=False)
+        monkeypatch.setenv("STUB_FAILING_COMMAND", "collectstatic")
+
+        with pytest.raises(subprocess.CalledProcessError):
+            project.run_collectstatic_and_migrate()
+
+        assert log.read_text().splitlines() == ["collectstatic --noinput custom.settings"]
 
 
 class TestUpdateWsgiFile:
@@ -25,8 +25,7 @@ class TestMain:
             call.find_django_files(),
             call.update_wsgi_file(),
             call.update_settings_file(),
-            call.run_collectstatic(),
-            call.run_migrate(),
+            call.run_collectstatic_and_migrate(),
             call.webapp.reload(),
             call.start_bash(),
         ]
@@ -12,19 +12,34 @@ class TestMain:
         with patch("scripts.pa_start_django_webapp_with_virtualenv.DjangoProject") as mock_DjangoProject:
             main("www.domain.com", "django.version", "python.version", nuke="nuke option")
         assert mock_DjangoProject.call_args == call("www.domain.com", "python.version")
-        assert mock_DjangoProject.return_value.method_calls == [
+        method_calls = mock_DjangoProject.return_value.method_calls
+        assert method_calls[:6] == [
             call.sanity_checks(nuke="nuke option"),
+            call.start_deleting_project_path(),
             call.create_virtualenv("django.version", nuke="nuke option"),
             call.run_startproject(nuke="nuke option"),
             call.find_django_files(),
             call.update_settings_file(),
-            call.run_collectstatic(),
-            call.create_webapp(nuke="nuke option"),
+        ]
+        # collectstatic and webapp creation run concurrently, so either may come first
+        assert call.run_collectstatic() in method_calls[6:8]
+        assert call.create_webapp(nuke="nuke option") in method_calls[6:8]
+        assert method_calls[8:] == [
             call.add_static_file_mappings(),
             call.update_wsgi_file(),
             call.webapp.reload(),
         ]
 
+    def test_collectstatic_failure_stops_before_static_mappings_and_wsgi_file(self):
+        with patch("scripts.pa_start_django_webapp_with_virtualenv.DjangoProject") as mock_DjangoProject:
+            mock_DjangoProject.return_value.run_collectstatic.side_effect = subprocess.CalledProcessError(1, "cmd")
+            with pytest.raises(subprocess.CalledProcessError):
+                main("www.domain.com", "django.version", "python.version", nuke=False)
+        method_calls = mock_DjangoProject.return_value.method_calls
+        assert call.add_static_file_mappings() not in method_calls
+        assert call.update_wsgi_file() not in method_calls
+        assert call.webapp.reload() not in method_calls
+
     @pytest.mark.slowtest
     def test_actually_creates_django_project_in_virtualenv_with_hacked_settings_and_static_files(
         self, fake_home, virtualenvs_folder, api_token
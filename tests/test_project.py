@@ -34,13 +34,13 @@ class TestProject:
 
 class TestSanityChecks:
     def test_calls_webapp_sanity_checks(self, fake_home, virtualenvs_folder):
-        project = Project('mydomain.com', 'python.version')
+        project = Project('mydomain.com', '3.8')
         project.webapp.sanity_checks = Mock()
         project.sanity_checks(nuke='nuke.option')
         assert project.webapp.sanity_checks.call_args == call(nuke='nuke.option')
 
     def test_raises_if_virtualenv_exists(self, fake_home, virtualenvs_folder):
-        project = Project('mydomain.com', 'python.version')
+        project = Project('mydomain.com', '3.8')
         project.webapp.sanity_checks = Mock()
         project.virtualenv.path.mkdir()
 
@@ -51,7 +51,7 @@ class TestSanityChecks:
         assert "nuke" in str(e.value)
 
     def test_raises_if_project_path_exists(self, fake_home, virtualenvs_folder):
-        project = Project('mydomain.com', 'python.version')
+        project = Project('mydomain.com', '3.8')
         project.webapp.sanity_checks = Mock()
         project.project_path.mkdir()
 
@@ -62,8 +62,29 @@ class TestSanityChecks:
         assert expected_msg in str(e.value)
         assert "nuke" in str(e.value)
 
+    def test_raises_if_python_version_not_supported(self, fake_home, virtualenvs_folder):
+        project = Project('mydomain.com', '1.5')
+        project.webapp.sanity_checks = Mock()
+
+        with pytest.raises(SanityException) as e:
+            project.sanity_checks(nuke=True)
+
+        assert "Python 1.5 is not supported" in str(e.value)
+        assert "3.8" in str(e.value)
+        assert project.webapp.sanity_checks.call_count == 0
+
+    def test_checks_local_folders_before_calling_api(self, fake_home, virtualenvs_folder):
+        project = Project('mydomain.com', '3.8')
+        project.webapp.sanity_checks = Mock()
+        project.project_path.mkdir()
+
+        with pytest.raises(SanityException):
+            project.sanity_checks(nuke=False)
+
+        assert project.webapp.sanity_checks.call_count == 0
+
     def test_nuke_option_overrides_directory_checks(self, fake_home, virtualenvs_folder):
-        project = Project('mydomain.com', 'python.version')
+        project = Project('mydomain.com', '3.8')
         project.webapp.sanity_checks = Mock()
         project.project_path.mkdir()
         project.virtualenv.path.mkdir()
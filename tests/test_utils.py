@@ -1,7 +1,7 @@
 import getpass
 from unittest.mock import patch
 
-from pythonanywhere.utils import ensure_domain
+from pythonanywhere.utils import ensure_domain, fast_rmtree
 
 
 class TestEnsureDomain:
@@ -29,3 +29,17 @@ class TestEnsureDomain:
         result = ensure_domain(custom_domain)
 
         assert result == custom_domain
+
+
+class TestFastRmtree:
+    def test_deletes_directory_and_contents(self, tmp_path):
+        target = tmp_path / "target"
+        (target / "nested").mkdir(parents=True)
+        (target / "nested" / "file.txt").touch()
+
+        fast_rmtree(target)
+
+        assert not target.exists()
+
+    def test_does_nothing_if_directory_does_not_exist(self, tmp_path):
+        fast_rmtree(tmp_path / "not-there")  # should not raise
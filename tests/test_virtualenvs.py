@@ -1,6 +1,7 @@
 import subprocess
 from pathlib import Path
 from platform import python_version
+from unittest.mock import call
 
 import pytest
 from pythonanywhere.virtualenvs import Virtualenv
@@ -11,29 +12,33 @@ class TestVirtualenv:
         v = Virtualenv("domain.com", "python.version")
         assert v.path == Path(virtualenvs_folder) / "domain.com"
 
-    def test_create_uses_bash_and_sources_virtualenvwrapper(self, mock_subprocess, virtualenvs_folder):
+    def test_create_runs_venv_module_of_requested_python(self, mock_subprocess, virtualenvs_folder):
         v = Virtualenv("domain.com", "3.8")
         v.create(nuke=False)
         args, kwargs = mock_subprocess.check_call.call_args
-        command_list = args[0]
-        assert command_list[:2] == ["bash", "-c"]
-        assert command_list[2].startswith("source virtualenvwrapper.sh && mkvirtualenv")
+        assert args[0] == ["python3.8", "-m", "venv", str(v.path)]
 
-    def test_create_calls_mkvirtualenv_with_python_version_and_domain(self, mock_subprocess, virtualenvs_folder):
+    def test_create_does_not_delete_existing_virtualenv_without_nuke(self, mock_subprocess, virtualenvs_folder):
         v = Virtualenv("domain.com", "3.8")
+        v.path.mkdir()
+        (v.path / "old-thing.txt").touch()
         v.create(nuke=False)
-        args, kwargs = mock_subprocess.check_call.call_args
-        command_list = args[0]
-        bash_command = command_list[2]
-        assert "mkvirtualenv --python=python3.8 domain.com" in bash_command
+        assert (v.path / "old-thing.txt").exists()
 
-    def test_nuke_option_deletes_virtualenv(self, mock_subprocess, virtualenvs_folder):
+    def test_nuke_option_deletes_virtualenv(self, mock_subprocess_except_rm, virtualenvs_folder):
         v = Virtualenv("domain.com", "3.8")
+        v.path.mkdir()
+        (v.path / "old-thing.txt").touch()
         v.create(nuke=True)
-        args, kwargs = mock_subprocess.check_call.call_args
-        command_list = args[0]
-        assert command_list[:2] == ["bash", "-c"]
-        assert command_list[2].startswith("source virtualenvwrapper.sh && rmvirtualenv domain.com")
+        assert not v.path.exists()
+        assert mock_subprocess_except_rm.check_call.call_args_list == [
+            call(["rm", "-rf", str(v.path)]),
+            call(["python3.8", "-m", "venv", str(v.path)]),
+        ]
+
+    def test_nuke_option_handles_virtualenv_not_existing(self, mock_subprocess, virtualenvs_folder):
+        v = Virtualenv("domain.com", "3.8")
+        v.create(nuke=True)  # should not raise
 
     def test_install_pip_installs_each_package(self, mock_subprocess, virtualenvs_folder):
         v = Virtualenv("domain.com", "3.8")